@@ -366,7 +366,8 @@ paddle.nn.TransformerDecoder.__init__ = layer_init_wrapper(_decoder_init)
 
 def _get_wrap_setattr(cls):
     def _wrap_setattr(self, name, value):
-        value = adapt_stale_fwd_patch(self, name, value)
+        if name == "forward":
+            value = adapt_stale_fwd_patch(self, name, value)
         return super(cls, self).__setattr__(name, value)
 
     return _wrap_setattr
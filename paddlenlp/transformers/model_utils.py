@@ -959,7 +959,8 @@ class PretrainedModel(Layer, GenerationMixin, ConversionMixin):
         return new_embeddings
 
     def __setattr__(self, name, value):
-        value = adapt_stale_fwd_patch(self, name, value)
+        if name == "forward":
+            value = adapt_stale_fwd_patch(self, name, value)
         return super(PretrainedModel, self).__setattr__(name, value)
 
     @classmethod
@@ -28,59 +28,94 @@ from paddlenlp.utils.env import HF_CACHE_HOME, MODEL_HOME
 from paddlenlp.utils.import_utils import import_module
 from paddlenlp.utils.log import logger
 
+# `inspect.getfullargspec` is pure but expensive, and the functions inspected
+# here (`__init__`/`forward` of model classes) are long-lived, so memoize it.
+_cached_getfullargspec = functools.lru_cache(maxsize=1024)(inspect.getfullargspec)
+
 
 def fn_args_to_dict(func, *args, **kwargs):
     """
     Inspect function `func` and its arguments for running, and extract a
     dict mapping between argument names and keys.
     """
-    if hasattr(inspect, "getfullargspec"):
-        (spec_args, spec_varargs, spec_varkw, spec_defaults, _, _, _) = inspect.getfullargspec(func)
-    else:
-        (spec_args, spec_varargs, spec_varkw, spec_defaults) = inspect.getargspec(func)
-    # add positional argument values
-    init_dict = dict(zip(spec_args, args))
-    # add default argument values
-    kwargs_dict = dict(zip(spec_args[-len(spec_defaults) :], spec_defaults)) if spec_defaults else {}
-    for k in list(kwargs_dict.keys()):
-        if k in init_dict:
-            kwargs_dict.pop(k)
-    kwargs_dict.update(kwargs)
-    init_dict.update(kwargs_dict)
+    (spec_args, spec_varargs, spec_varkw, spec_defaults, _, _, _) = _cached_getfullargspec(func)
+    # merge in increasing order of precedence: default argument values first,
+    # then positional argument values, then keyword argument values
+    init_dict = {}
+    if spec_defaults:
+        init_dict.update(zip(spec_args[-len(spec_defaults) :], spec_defaults))
+    init_dict.update(zip(spec_args, args))
+    init_dict.update(kwargs)
     return init_dict
 
 
+@functools.lru_cache(maxsize=2048)
+def _missing_fwd_patch_args(patch_code, fwd_code):
+    """
+    Get the arguments of the latest `forward` (identified by its code object)
+    which are missing from a stale patch. Code objects are stable and hashable,
+    so the diff is computed at most once per `(patch, forward)` pair.
+    """
+    patch_args_set = frozenset(patch_code.co_varnames[: patch_code.co_argcount])
+    spec_args_set = frozenset(fwd_code.co_varnames[: fwd_code.co_argcount])
+    return tuple(arg for arg in _FWD_COMPAT_ARGS if arg not in patch_args_set and arg in spec_args_set)
+
+
+# `forward` arguments added over time which stale patches may be missing
+_FWD_COMPAT_ARGS = ("output_hidden_states", "output_attentions", "return_dict")
+
+# type of paddle's `StaticFunction`, recorded the first time one is seen so
+# that the string-compare fallback in `adapt_stale_fwd_patch` runs only once
+_static_fn_type: Optional[type] = None
+
+
+@functools.lru_cache(maxsize=128)
+def _wrap_stale_fwd(value, new_args):
+    """
+    Build (or reuse) the compatibility wrapper dropping `new_args` before
+    calling the stale patch `value`. The wrapper only depends on its cache
+    key, so re-patching the same forward reuses the same function object
+    instead of allocating and `functools.wraps`-copying a new one.
+    """
+
+    @functools.wraps(value)
+    def wrap_fwd(*args, **kwargs):
+        for arg in new_args:
+            kwargs.pop(arg, None)
+        return value(*args, **kwargs)
+
+    return wrap_fwd
+
+
 def adapt_stale_fwd_patch(self, name, value):
     """
     Since there are some monkey patches for forward of PretrainedModel, such as
     model compression, we make these patches compatible with the latest forward
     method.
     """
+    global _static_fn_type
     if name == "forward":
         # NOTE(guosheng): In dygraph to static, `layer.forward` would be patched
         # by an instance of `StaticFunction`. And use string compare to avoid to
-        # import fluid.
+        # import fluid. Once seen, the type is remembered so that later calls
+        # use a plain isinstance check instead of the name compare.
+        if _static_fn_type is not None and isinstance(value, _static_fn_type):
+            return value
         if type(value).__name__.endswith("StaticFunction"):
+            _static_fn_type = type(value)
+            return value
+        if not callable(value):
             return value
-        if hasattr(inspect, "getfullargspec"):
-            (
-                patch_spec_args,
-                patch_spec_varargs,
-                patch_spec_varkw,
-                patch_spec_defaults,
-                _,
-                _,
-                _,
-            ) = inspect.getfullargspec(value)
-            (spec_args, spec_varargs, spec_varkw, spec_defaults, _, _, _) = inspect.getfullargspec(self.forward)
+        patch_code = getattr(value, "__code__", None)
+        fwd_code = getattr(self.forward, "__code__", None)
+        if patch_code is not None and fwd_code is not None:
+            new_args = _missing_fwd_patch_args(patch_code, fwd_code)
         else:
-            (patch_spec_args, patch_spec_varargs, patch_spec_varkw, patch_spec_defaults) = inspect.getargspec(value)
-            (spec_args, spec_varargs, spec_varkw, spec_defaults) = inspect.getargspec(self.forward)
-        new_args = [
-            arg
-            for arg in ("output_hidden_states", "output_attentions", "return_dict")
-            if arg not in patch_spec_args and arg in spec_args
-        ]
+            # callables without a code object (e.g. `functools.partial`) are
+            # rare here, inspect them directly
+            patch_args_set = frozenset(_cached_getfullargspec(value).args)
+            spec_args_set = frozenset(_cached_getfullargspec(self.forward).args)
+            new_args = tuple(arg for arg in _FWD_COMPAT_ARGS if arg not in patch_args_set and arg in spec_args_set)
 
         if new_args:
             if self.__module__.startswith("paddlenlp"):
@@ -100,22 +135,16 @@ def adapt_stale_fwd_patch(self, name, value):
                     "these arguemnts, and maybe the patch should be updated."
                 )
             if isinstance(self, Layer) and inspect.isfunction(value):
-
+                # the wrapper closes over the layer instance to bind `self`,
+                # so it cannot be shared and is built per patch
                 @functools.wraps(value)
                 def wrap_fwd(*args, **kwargs):
                     for arg in new_args:
                         kwargs.pop(arg, None)
                     return value(self, *args, **kwargs)
 
-            else:
-
-                @functools.wraps(value)
-                def wrap_fwd(*args, **kwargs):
-                    for arg in new_args:
-                        kwargs.pop(arg, None)
-                    return value(*args, **kwargs)
-
-            return wrap_fwd
+                return wrap_fwd
+            return _wrap_stale_fwd(value, new_args)
     return value
 
 
@@ -137,8 +166,13 @@ class InitTrackerMeta(type(Layer)):
         # If attrs has `__init__`, wrap it using accessable `_pre_init, _post_init`.
         # Otherwise, no need to wrap again since the super cls has been wraped.
         # TODO: remove reduplicated tracker if using super cls `__init__`
-        pre_init_func = getattr(cls, "_pre_init", None) if "__init__" in attrs else None
-        post_init_func = getattr(cls, "_post_init", None) if "__init__" in attrs else None
+        if "__init__" in attrs:
+            # check the class body first and only fall back to the MRO walk
+            # when the hook is inherited
+            pre_init_func = attrs.get("_pre_init") or getattr(cls, "_pre_init", None)
+            post_init_func = attrs.get("_post_init") or getattr(cls, "_post_init", None)
+        else:
+            pre_init_func = post_init_func = None
         cls.__init__ = InitTrackerMeta.init_and_track_conf(init_func, pre_init_func, post_init_func)
         super(InitTrackerMeta, cls).__init__(name, bases, attrs)
 
@@ -161,25 +195,64 @@ class InitTrackerMeta(type(Layer)):
             function: the wrapped function
         """
 
-        @functools.wraps(init_func)
-        def __impl__(self, *args, **kwargs):
-            # registed helper by `pre_init_func`
-            if pre_init_func:
+        # Specialize the wrapper on which hooks are registered at class-creation
+        # time, so instance construction pays no per-call branches for absent
+        # hooks.
+        if pre_init_func and post_init_func:
+
+            def __impl__(self, *args, **kwargs):
+                pre_init_func(self, init_func, *args, **kwargs)
+                # keep full configuration
+                init_func(self, *args, **kwargs)
+                post_init_func(self, init_func, *args, **kwargs)
+                init_config = dict(kwargs)
+                if args:
+                    init_config["init_args"] = args
+                init_config["init_class"] = self.__class__.__name__
+                self.init_config = init_config
+
+        elif pre_init_func:
+
+            def __impl__(self, *args, **kwargs):
                 pre_init_func(self, init_func, *args, **kwargs)
-            # keep full configuration
-            init_func(self, *args, **kwargs)
-            # registed helper by `post_init_func`
-            if post_init_func:
+                # keep full configuration
+                init_func(self, *args, **kwargs)
+                init_config = dict(kwargs)
+                if args:
+                    init_config["init_args"] = args
+                init_config["init_class"] = self.__class__.__name__
+                self.init_config = init_config
+
+        elif post_init_func:
+
+            def __impl__(self, *args, **kwargs):
+                # keep full configuration
+                init_func(self, *args, **kwargs)
                 post_init_func(self, init_func, *args, **kwargs)
-            self.init_config = kwargs
-            if args:
-                kwargs["init_args"] = args
-            kwargs["init_class"] = self.__class__.__name__
+                init_config = dict(kwargs)
+                if args:
+                    init_config["init_args"] = args
+                init_config["init_class"] = self.__class__.__name__
+                self.init_config = init_config
+
+        else:
 
-        return __impl__
+            def __impl__(self, *args, **kwargs):
+                # keep full configuration
+                init_func(self, *args, **kwargs)
+                init_config = dict(kwargs)
+                if args:
+                    init_config["init_args"] = args
+                init_config["init_class"] = self.__class__.__name__
+                self.init_config = init_config
+
+        return functools.wraps(init_func)(__impl__)
 
     def __setattr__(self, name, value):
-        value = adapt_stale_fwd_patch(self, name, value)
+        # Inline the name check so that the overwhelmingly common non-forward
+        # assignments skip the call into `adapt_stale_fwd_patch` entirely.
+        if name == "forward":
+            value = adapt_stale_fwd_patch(self, name, value)
         return super(InitTrackerMeta, self).__setattr__(name, value)
 
 
@@ -193,18 +266,22 @@ def param_in_func(func, param_field: str) -> bool:
     Returns:
         bool: the result of existence
     """
-
-    if hasattr(inspect, "getfullargspec"):
-        result = inspect.getfullargspec(func)
-    else:
-        result = inspect.getargspec(func)
-
-    return param_field in result[0]
+    code = getattr(func, "__code__", None)
+    if code is None:
+        # callables without a code object (e.g. `functools.partial`)
+        return param_field in _cached_getfullargspec(func).args
+    # equivalent to `getfullargspec(func).args` without building the full spec
+    return param_field in code.co_varnames[: code.co_argcount]
 
 
+@functools.lru_cache(maxsize=256)
 def resolve_cache_dir(pretrained_model_name_or_path: str, from_hf_hub: bool, cache_dir: Optional[str] = None) -> str:
     """resolve cache dir for PretrainedModel and PretrainedConfig
 
+    The result is cached since loading one model resolves the same dir several
+    times (config, tokenizer, weights) and each resolution costs a stat
+    syscall. Use `resolve_cache_dir.cache_clear()` to invalidate manually.
+
     Args:
         pretrained_model_name_or_path (str): the name or path of pretrained model
         from_hf_hub (bool): if load from huggingface hub
@@ -222,13 +299,32 @@ def resolve_cache_dir(pretrained_model_name_or_path: str, from_hf_hub: bool, cac
     else:
         if cache_dir is not None:
             # since model_clas.from_pretrained calls config_clas.from_pretrained, the model_name may get appended twice
-            if cache_dir.endswith(pretrained_model_name_or_path):
+            # compare on normalized path-component boundaries so that e.g. a
+            # `.../roberta-wwm-ext` cache dir is not mistaken for `wwm-ext`
+            norm_cache_dir = os.path.normpath(cache_dir)
+            norm_name = os.path.normpath(pretrained_model_name_or_path)
+            if norm_cache_dir == norm_name or norm_cache_dir.endswith(os.sep + norm_name):
                 return cache_dir
             else:
                 return os.path.join(cache_dir, pretrained_model_name_or_path)
         return os.path.join(MODEL_HOME, pretrained_model_name_or_path)
 
 
+# `PretrainedModel` resolved on first use; importing it at module load would
+# be circular since `paddlenlp.transformers` imports this module
+_pretrained_model_cls: Optional[type] = None
+
+
+def _get_pretrained_model_cls() -> type:
+    global _pretrained_model_cls
+    if _pretrained_model_cls is None:
+        from paddlenlp.transformers import PretrainedModel
+
+        _pretrained_model_cls = PretrainedModel
+    return _pretrained_model_cls
+
+
+@functools.lru_cache(maxsize=None)
 def find_transformer_model_type(model_class: Type) -> str:
     """get the model type from module name,
         eg:
@@ -241,11 +337,9 @@ def find_transformer_model_type(model_class: Type) -> str:
     Returns:
         str: the type string
     """
-    from paddlenlp.transformers import PretrainedModel
-
     default_model_type = ""
 
-    if not issubclass(model_class, PretrainedModel):
+    if not issubclass(model_class, _get_pretrained_model_cls()):
         return default_model_type
 
     module_name: str = model_class.__module__
@@ -259,6 +353,13 @@ def find_transformer_model_type(model_class: Type) -> str:
     return tokens[2]
 
 
+# name -> class mapping over `paddlenlp.transformers`, built lazily on first
+# lookup; the module-dict length records when it was built so the cache is
+# rebuilt if the module contents change (e.g. on re-import).
+_transformer_model_class_cache: dict = {}
+_transformer_module_size: int = -1
+
+
 def find_transformer_model_class_by_name(model_name: str) -> Optional[Type[PretrainedModel]]:
     """find transformer model_class by name
 
@@ -268,20 +369,23 @@ def find_transformer_model_class_by_name(model_name: str) -> Optional[Type[Pretr
     Returns:
         Optional[Type[PretrainedModel]]: optional pretrained-model class
     """
+    global _transformer_model_class_cache, _transformer_module_size
     transformer_module = import_module("paddlenlp.transformers")
-
-    for obj_name in dir(transformer_module):
-        if obj_name.startswith("_"):
-            continue
-        obj = getattr(transformer_module, obj_name, None)
-        if obj is None:
-            continue
-
-        name = getattr(obj, "__name__", None)
-        if name is None:
-            continue
-
-        if name == model_name:
-            return obj
-    logger.debug(f"can not find model_class<{model_name}>")
-    return None
+    module_dict = vars(transformer_module)
+
+    model_class_cache = _transformer_model_class_cache
+    if len(module_dict) != _transformer_module_size:
+        # build into a local dict and publish atomically, so concurrent
+        # lookups never observe a partially rebuilt cache
+        model_class_cache = {}
+        for obj_name, obj in module_dict.items():
+            if obj_name.startswith("_") or not inspect.isclass(obj):
+                continue
+            model_class_cache.setdefault(obj.__name__, obj)
+        _transformer_model_class_cache = model_class_cache
+        _transformer_module_size = len(module_dict)
+
+    model_class = model_class_cache.get(model_name)
+    if model_class is None:
+        logger.debug(f"can not find model_class<{model_name}>")
+    return model_class
@@ -13,8 +13,11 @@
 # limitations under the License.
 
 import json
+import os
 import unittest
 
+from paddle.nn import Layer
+
 from paddlenlp.transformers import (
     AlbertForTokenClassification,
     AlbertModel,
@@ -35,6 +38,76 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(utils.find_transformer_model_type(BertForTokenClassification), "bert")
 
 
+class TestResolveCacheDir(unittest.TestCase):
+    """Unittest for `resolve_cache_dir`"""
+
+    def test_name_substring_of_cache_dir(self):
+        """the name matching only a substring of the last component must still be appended"""
+        self.assertEqual(
+            utils.resolve_cache_dir("bert", False, cache_dir="/x/distilbert"),
+            os.path.join("/x/distilbert", "bert"),
+        )
+
+    def test_cache_dir_ends_with_name(self):
+        """a cache dir already ending with the name component is returned unchanged"""
+        self.assertEqual(utils.resolve_cache_dir("bert", False, cache_dir="/x/bert"), "/x/bert")
+
+    def test_multi_component_name(self):
+        """community `org/name` identifiers match (or get appended) as whole components"""
+        self.assertEqual(utils.resolve_cache_dir("org/model", False, cache_dir="/x/org/model"), "/x/org/model")
+        self.assertEqual(
+            utils.resolve_cache_dir("org/model", False, cache_dir="/x"),
+            os.path.join("/x", "org/model"),
+        )
+
+
+class TestInitTrackerMeta(unittest.TestCase):
+    """Unittest for `InitTrackerMeta` hook dispatch and `init_config` tracking"""
+
+    def _build_tracked_class(self, with_pre: bool, with_post: bool, calls: list):
+        """create a small `InitTrackerMeta` class recording its hook calls"""
+
+        def __init__(self, *args, **kwargs):
+            Layer.__init__(self)
+            calls.append("init")
+
+        attrs = {"__init__": __init__}
+        if with_pre:
+
+            def _pre_init(self, original_init, *args, **kwargs):
+                calls.append("pre")
+
+            attrs["_pre_init"] = _pre_init
+        if with_post:
+
+            def _post_init(self, original_init, *args, **kwargs):
+                calls.append("post")
+
+            attrs["_post_init"] = _post_init
+        return utils.InitTrackerMeta("Tracked", (Layer,), attrs)
+
+    def test_hook_call_order(self):
+        """test hook order for all four `_pre_init`/`_post_init` combinations"""
+        for with_pre in (False, True):
+            for with_post in (False, True):
+                calls = []
+                tracked_class = self._build_tracked_class(with_pre, with_post, calls)
+                tracked_class(1, b=2)
+                expected_calls = (["pre"] if with_pre else []) + ["init"] + (["post"] if with_post else [])
+                self.assertEqual(calls, expected_calls)
+
+    def test_init_config(self):
+        """test `init_config` keeps kwargs and the `init_args`/`init_class` keys"""
+        for with_pre in (False, True):
+            for with_post in (False, True):
+                tracked_class = self._build_tracked_class(with_pre, with_post, [])
+                instance = tracked_class(1, b=2)
+                self.assertEqual(instance.init_config, {"b": 2, "init_args": (1,), "init_class": "Tracked"})
+                # `init_args` is only tracked when positional arguments are passed
+                instance = tracked_class(b=2)
+                self.assertEqual(instance.init_config, {"b": 2, "init_class": "Tracked"})
+
+
 def check_json_file_has_correct_format(file_path):
     with open(file_path, "r") as f:
         try: